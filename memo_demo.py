@@ -6,13 +6,65 @@
 """
 
 import cv2
+import numpy as np
 import time
 import os
 import sys
+import queue
 import threading
 
 # 메모 모듈
-from memo_module import SmartMirrorMemo, SPEECH_RECOGNITION_AVAILABLE, PYAUDIO_AVAILABLE
+from memo_module import SmartMirrorMemo, SPEECH_RECOGNITION_AVAILABLE, AUDIO_RECORDING_AVAILABLE
+
+# 파이프라인 단계 사이 큐 크기
+PIPELINE_DEPTH = 4
+
+# 데모 창 이름
+WINDOW_NAME = "Smart Mirror Memo Demo"
+
+# 하단 도움말 바 높이
+HELP_BAR_HEIGHT = 40
+
+
+def build_help_strip(width: int) -> np.ndarray:
+    """하단 도움말 바 이미지 생성 (시작 시 한 번만 그림)"""
+    strip = np.zeros((HELP_BAR_HEIGHT, width, 3), dtype=np.uint8)
+    cv2.putText(strip, "V:Voice | R:Video | S:Stop | P:Player | Q:Quit",
+               (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+    return strip
+
+
+def _banner_width(text: str, scale: float, min_width: int) -> int:
+    """글자가 잘리지 않는 배너 너비 (기본 너비보다 길면 글자 길이에 맞춤)"""
+    (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+    return max(min_width, text_width + 20)
+
+
+def build_status_banner(text: str) -> np.ndarray:
+    """녹화 상태 배너 이미지 생성 (화면 (50, 10)부터, 최소 (350, 50)까지)"""
+    banner = np.zeros((41, _banner_width(text, 0.7, 301), 3), dtype=np.uint8)
+    cv2.putText(banner, text, (10, 30),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return banner
+
+
+def build_ready_banner() -> np.ndarray:
+    """대기 상태 배너 이미지 생성 (화면 (10, 10)부터, 최소 (300, 50)까지)"""
+    text = "Ready - Say 'memo' to start"
+    banner = np.zeros((41, _banner_width(text, 0.6, 291), 3), dtype=np.uint8)
+    cv2.putText(banner, text, (10, 28),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    return banner
+
+
+def blit(dst: np.ndarray, sprite: np.ndarray, x: int, y: int):
+    """미리 그린 이미지를 (x, y)에 복사 (화면 밖으로 나가는 부분은 잘라냄)"""
+    height, width = dst.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + sprite.shape[1], width)
+    y1 = min(y + sprite.shape[0], height)
+    if x0 < x1 and y0 < y1:
+        dst[y0:y1, x0:x1] = sprite[y0 - y:y1 - y, x0 - x:x1 - x]
 
 
 def main():
@@ -21,7 +73,7 @@ def main():
     print("=" * 50)
     print()
     print(f"음성 인식: {'✓ 사용 가능' if SPEECH_RECOGNITION_AVAILABLE else '✗ 사용 불가'}")
-    print(f"오디오 녹음: {'✓ 사용 가능' if PYAUDIO_AVAILABLE else '✗ 사용 불가'}")
+    print(f"오디오 녹음: {'✓ 사용 가능' if AUDIO_RECORDING_AVAILABLE else '✗ 사용 불가'}")
     print()
     
     # 메모 모듈 초기화
@@ -51,6 +103,9 @@ def main():
         print("Error: 카메라를 열 수 없습니다.")
         return
     
+    # 내부 버퍼 최소화 (입력 지연 감소)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
     # 프레임 크기 가져오기
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -76,66 +131,154 @@ def main():
     # 메모 시스템 시작 (음성 명령 대기)
     memo.start()
     
-    try:
-        while cap.isOpened():
-            ret, frame = cap.read()
+    # 파이프라인 큐 (캡처 → 오버레이/표시, 인코딩은 VideoRecorder 스레드에서 처리)
+    read_q = queue.Queue(maxsize=PIPELINE_DEPTH)
+    stop_event = threading.Event()
+    
+    def put_until_stopped(q, item) -> bool:
+        """큐에 여유가 생길 때까지 대기 (종료 요청 시 포기)"""
+        while not stop_event.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def read_loop():
+        """카메라 프레임 수신 스레드"""
+        while not stop_event.is_set():
+            if not cap.grab():
+                break
+            
+            # 화면 표시가 밀려 있고 영상 녹화 중이 아니면 디코딩 생략
+            if read_q.full() and memo.get_recording_mode() != "video":
+                continue
+            
+            ret, frame = cap.retrieve()
             if not ret:
+                break
+            if not put_until_stopped(read_q, frame):
+                return
+        
+        # 종료 신호
+        put_until_stopped(read_q, None)
+    
+    # 오버레이/합성 버퍼 (프레임마다 새로 할당하지 않음)
+    overlay = np.empty((frame_height, frame_width, 3), dtype=np.uint8)
+    blended = np.empty_like(overlay)
+    
+    # OpenCL(Transparent API)을 쓸 수 있으면 합성을 GPU에서 처리
+    use_opencl = cv2.ocl.haveOpenCL()
+    if use_opencl:
+        cv2.ocl.setUseOpenCL(True)
+        uframe = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+        uoverlay = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+        ublended = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+    
+    # 매 프레임 동일한 정적 오버레이는 미리 그려 둠
+    help_strip = build_help_strip(frame_width)
+    ready_banner = build_ready_banner()
+    
+    # 녹화 상태 배너는 표시 내용(모드, 경과 초)이 바뀔 때만 다시 그림
+    status_key = None
+    status_banner = None
+    
+    # 루프에서 반복 조회하는 함수는 지역 변수로 바인딩
+    rs = recording_status
+    get_mode = memo.get_recording_mode
+    write_video_frame = memo.write_video_frame
+    now = time.time
+    flip = cv2.flip
+    add_weighted = cv2.addWeighted
+    copy_to = cv2.copyTo
+    imshow = cv2.imshow
+    wait_key = cv2.waitKey
+    alpha = 0.7
+    
+    cv2.namedWindow(WINDOW_NAME)
+    last_show = 0.0
+    
+    read_thread = threading.Thread(target=read_loop, daemon=True)
+    read_thread.start()
+    
+    try:
+        while True:
+            frame = read_q.get()
+            if frame is None:
                 print("프레임을 읽을 수 없습니다.")
                 break
             
             # 좌우 반전 (거울 모드)
-            frame = cv2.flip(frame, 1)
+            frame = flip(frame, 1)
             
             # 영상 녹화 중이면 프레임 저장
-            if memo.get_recording_mode() == "video":
-                memo.write_video_frame(frame)
-            
-            # 상태 표시 오버레이
-            overlay = frame.copy()
+            if get_mode() == "video":
+                write_video_frame(frame)
             
-            # 녹화 상태 표시
-            if recording_status["mode"]:
-                mode = recording_status["mode"]
-                elapsed = time.time() - recording_status["start_time"]
+            # 창이 보이지 않으면 합성/표시를 1초에 한 번으로 줄임 (녹화는 계속)
+            # 닫힌 창(0 또는 -1)이나 속성을 지원하지 않는 백엔드(-1)도 같은 경로로 처리해
+            # 주기적으로 imshow를 호출해 창을 다시 만들고 키 입력을 받음 (종료는 Q 키로만)
+            visible = cv2.getWindowProperty(WINDOW_NAME, cv2.WND_PROP_VISIBLE)
+            if visible >= 1 or now() - last_show >= 1.0:
+                last_show = now()
+                # 상태 표시 오버레이
+                if overlay.shape != frame.shape:
+                    frame_height, frame_width = frame.shape[:2]
+                    overlay = np.empty_like(frame)
+                    blended = np.empty_like(frame)
+                    if use_opencl:
+                        uframe = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+                        uoverlay = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+                        ublended = cv2.UMat(frame_height, frame_width, cv2.CV_8UC3)
+                    help_strip = build_help_strip(frame_width)
+                np.copyto(overlay, frame)
                 
-                # 녹화 표시 (빨간 원)
-                cv2.circle(overlay, (30, 30), 15, (0, 0, 255), -1)
+                # 녹화 상태 표시
+                mode = rs["mode"]
+                start_time = rs["start_time"]
+                if mode and start_time is not None:
+                    elapsed = int(now() - start_time)
+                    
+                    if (mode, elapsed) != status_key:
+                        status_key = (mode, elapsed)
+                    
+                        # 녹화 시간
+                        minutes, seconds = divmod(elapsed, 60)
+                        time_text = f"{minutes:02d}:{seconds:02d}"
+                    
+                        if mode == "voice":
+                            status_text = f"🎤 음성 녹음 중... {time_text}"
+                        else:
+                            status_text = f"🎥 영상 녹화 중... {time_text}"
+                        status_banner = build_status_banner(status_text)
+                    
+                    # 녹화 표시 (빨간 원)
+                    cv2.circle(overlay, (30, 30), 15, (0, 0, 255), -1)
+                    blit(overlay, status_banner, 50, 10)
+                else:
+                    # 대기 상태
+                    blit(overlay, ready_banner, 10, 10)
                 
-                # 녹화 시간
-                minutes = int(elapsed // 60)
-                seconds = int(elapsed % 60)
-                time_text = f"{minutes:02d}:{seconds:02d}"
+                # 도움말 표시 (하단)
+                blit(overlay, help_strip, 0, frame_height - HELP_BAR_HEIGHT)
                 
-                if mode == "voice":
-                    status_text = f"🎤 음성 녹음 중... {time_text}"
+                # 오버레이 적용 (투명도)
+                if use_opencl:
+                    # 매 프레임 UMat을 새로 만들지 않고 기존 장치 버퍼에 업로드
+                    copy_to(frame, None, uframe)
+                    copy_to(overlay, None, uoverlay)
+                    add_weighted(uoverlay, alpha, uframe, 1 - alpha, 0, dst=ublended)
+                    display = ublended
                 else:
-                    status_text = f"🎥 영상 녹화 중... {time_text}"
+                    add_weighted(overlay, alpha, frame, 1 - alpha, 0, dst=blended)
+                    display = blended
                 
-                # 텍스트 배경
-                cv2.rectangle(overlay, (50, 10), (350, 50), (0, 0, 0), -1)
-                cv2.putText(overlay, status_text, (60, 40),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            else:
-                # 대기 상태
-                cv2.rectangle(overlay, (10, 10), (300, 50), (0, 0, 0), -1)
-                cv2.putText(overlay, "Ready - Say 'memo' to start", (20, 38),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-            
-            # 도움말 표시 (하단)
-            help_y = frame_height - 30
-            cv2.rectangle(overlay, (0, help_y - 10), (frame_width, frame_height), (0, 0, 0), -1)
-            cv2.putText(overlay, "V:Voice | R:Video | S:Stop | P:Player | Q:Quit",
-                       (10, help_y + 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-            
-            # 오버레이 적용 (투명도)
-            alpha = 0.7
-            frame = cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
-            
-            # 화면 표시
-            cv2.imshow("Smart Mirror Memo Demo", frame)
+                # 화면 표시
+                imshow(WINDOW_NAME, display)
             
             # 키 입력 처리
-            key = cv2.waitKey(1) & 0xFF
+            key = wait_key(1) & 0xFF
             
             if key == ord('q') or key == ord('Q'):
                 break
@@ -166,6 +309,8 @@ def main():
     finally:
         # 정리
         print("\n정리 중...")
+        stop_event.set()
+        read_thread.join(timeout=2)
         memo.stop()
         cap.release()
         cv2.destroyAllWindows()
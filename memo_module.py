@@ -5,12 +5,18 @@
 - 영상 메모 녹화 (MP4)
 """
 
+import atexit
 import os
+import queue
+import re
+import shutil
+import subprocess
 import threading
 import time
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple
 import cv2
 import numpy as np
 
@@ -22,13 +28,69 @@ except ImportError:
     SPEECH_RECOGNITION_AVAILABLE = False
     print("Warning: speech_recognition not installed. Voice commands disabled.")
 
-# 오디오 녹음 관련
+# 명령어 다중 패턴 매칭 (선택)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 오디오 녹음 관련 (sounddevice 우선, 없으면 PyAudio 사용)
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
 except ImportError:
     PYAUDIO_AVAILABLE = False
-    print("Warning: pyaudio not installed. Audio recording disabled.")
+
+AUDIO_RECORDING_AVAILABLE = SOUNDDEVICE_AVAILABLE or PYAUDIO_AVAILABLE
+if not AUDIO_RECORDING_AVAILABLE:
+    print("Warning: sounddevice/pyaudio not installed. Audio recording disabled.")
+
+
+class _ChunkPool:
+    """오디오 청크 버퍼 풀 (녹음 간 재사용)"""
+    
+    def __init__(self, size: int, count: int):
+        self._size = size
+        self._pool = queue.LifoQueue()
+        for _ in range(count):
+            self._pool.put(bytearray(size))
+    
+    def acquire(self) -> bytearray:
+        """버퍼 하나 꺼내기 (풀이 비어 있으면 새로 할당)"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return bytearray(self._size)
+    
+    def release(self, buf: bytearray):
+        """사용이 끝난 버퍼 반환"""
+        self._pool.put(buf)
+
+
+# PyAudio 인스턴스 (장치 목록 조회 비용이 커서 프로세스당 하나만 생성)
+_PYAUDIO_INSTANCE = None
+_PYAUDIO_LOCK = threading.Lock()
+
+
+def _get_pyaudio():
+    """공유 PyAudio 인스턴스 반환 (처음 호출 시 생성, 종료 시 정리)"""
+    global _PYAUDIO_INSTANCE
+    with _PYAUDIO_LOCK:
+        if _PYAUDIO_INSTANCE is None:
+            _PYAUDIO_INSTANCE = pyaudio.PyAudio()
+            atexit.register(_PYAUDIO_INSTANCE.terminate)
+        return _PYAUDIO_INSTANCE
+
+
+# 1024 프레임 16비트 모노 청크 기준 (모든 AudioRecorder가 공유)
+_CHUNK_POOL = _ChunkPool(1024 * 2, 32)
 
 
 class VoiceRecognizer:
@@ -48,7 +110,15 @@ class VoiceRecognizer:
         """
         self.callback = callback
         self.is_listening = False
-        self._listen_thread: Optional[threading.Thread] = None
+        self._stop_listener: Optional[Callable[..., None]] = None
+        self._stt_pool: Optional[ThreadPoolExecutor] = None
+        
+        # 명령어 키워드는 한 번만 소문자로 변환 (순서 = 우선순위)
+        self._commands_lower = [
+            (cmd_type, [keyword.lower() for keyword in keywords])
+            for cmd_type, keywords in self.COMMANDS.items()
+        ]
+        self._automaton = self._build_automaton() if AHOCORASICK_AVAILABLE else None
         
         if SPEECH_RECOGNITION_AVAILABLE:
             self.recognizer = sr.Recognizer()
@@ -70,50 +140,76 @@ class VoiceRecognizer:
             return
         
         self.is_listening = True
-        self._listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
-        self._listen_thread.start()
+        # 음성 인식 요청은 별도 스레드에서 처리 (수신과 병행)
+        # 작업자는 하나만 두어 명령이 말한 순서대로 하나씩 실행되게 함
+        self._stt_pool = ThreadPoolExecutor(max_workers=1)
+        # 마이크 스트림을 한 번 열어 둔 채 백그라운드에서 구문 단위로 수신
+        self._stop_listener = self.recognizer.listen_in_background(
+            self.microphone, self._on_phrase, phrase_time_limit=5
+        )
         print("Voice command listening started...")
     
     def stop_listening(self):
         """음성 명령 감지 중지"""
         self.is_listening = False
-        if self._listen_thread:
-            self._listen_thread.join(timeout=2)
+        if self._stop_listener:
+            self._stop_listener(wait_for_stop=False)
+            self._stop_listener = None
+        if self._stt_pool:
+            self._stt_pool.shutdown(wait=False, cancel_futures=True)
+            self._stt_pool = None
         print("Voice command listening stopped.")
     
-    def _listen_loop(self):
-        """백그라운드에서 음성 명령 감지"""
-        while self.is_listening:
-            try:
-                with self.microphone as source:
-                    # 3초 동안 음성 대기
-                    audio = self.recognizer.listen(source, timeout=3, phrase_time_limit=5)
+    def _on_phrase(self, recognizer, audio):
+        """구문 하나가 수신될 때마다 호출 (백그라운드 스레드)"""
+        pool = self._stt_pool
+        if not self.is_listening or pool is None:
+            return
+        
+        try:
+            pool.submit(self._recognize_and_dispatch, audio)
+        except RuntimeError:
+            pass  # 감지 중지 중
+    
+    def _recognize_and_dispatch(self, audio):
+        """음성 인식 후 명령 콜백 호출 (인식 스레드 풀)"""
+        try:
+            # Google Speech Recognition (무료, 인터넷 필요)
+            text = self.recognizer.recognize_google(audio, language="ko-KR")
+            print(f"인식된 음성: {text}")
+            
+            # 명령어 매칭
+            # 인식 중에 감지가 중지됐으면 명령을 실행하지 않음
+            command = self._match_command(text)
+            if command and self.callback and self.is_listening:
+                self.callback(command)
                 
-                try:
-                    # Google Speech Recognition (무료, 인터넷 필요)
-                    text = self.recognizer.recognize_google(audio, language="ko-KR")
-                    print(f"인식된 음성: {text}")
-                    
-                    # 명령어 매칭
-                    command = self._match_command(text)
-                    if command and self.callback:
-                        self.callback(command)
-                        
-                except sr.UnknownValueError:
-                    pass  # 음성을 인식하지 못함
-                except sr.RequestError as e:
-                    print(f"Speech recognition error: {e}")
-                    
-            except sr.WaitTimeoutError:
-                pass  # 타임아웃, 계속 대기
-            except Exception as e:
-                print(f"Voice recognition error: {e}")
-                time.sleep(0.5)
+        except sr.UnknownValueError:
+            pass  # 음성을 인식하지 못함
+        except sr.RequestError as e:
+            print(f"Speech recognition error: {e}")
+        except Exception as e:
+            print(f"Voice recognition error: {e}")
+    
+    def _build_automaton(self):
+        """모든 명령어 키워드를 담은 Aho-Corasick 오토마톤 생성"""
+        automaton = ahocorasick.Automaton()
+        for priority, (cmd_type, keywords) in enumerate(self._commands_lower):
+            for keyword in keywords:
+                automaton.add_word(keyword, (priority, cmd_type))
+        automaton.make_automaton()
+        return automaton
     
     def _match_command(self, text: str) -> Optional[str]:
         """텍스트에서 명령어 매칭"""
         text_lower = text.lower()
-        for cmd_type, keywords in self.COMMANDS.items():
+        
+        if self._automaton is not None:
+            # 한 번의 스캔으로 모든 키워드 검사, 여러 명령이 나오면 COMMANDS 순서 우선
+            matches = [value for _, value in self._automaton.iter(text_lower)]
+            return min(matches)[1] if matches else None
+        
+        for cmd_type, keywords in self._commands_lower:
             for keyword in keywords:
                 if keyword in text_lower:
                     return cmd_type
@@ -127,22 +223,28 @@ class AudioRecorder:
         self.save_dir = save_dir
         self.is_recording = False
         self._record_thread: Optional[threading.Thread] = None
-        self._frames: List[bytes] = []
         self._current_file: Optional[str] = None
         
         # 오디오 설정
         self.format = pyaudio.paInt16 if PYAUDIO_AVAILABLE else None
+        self.dtype = "int16"
+        self.sample_width = 2  # 16비트
         self.channels = 1
         self.rate = 44100
         self.chunk = 1024
         
+        # 녹음 중인 WAV 파일 (청크 단위로 바로 기록)
+        self._wf: Optional[wave.Wave_write] = None
+        self._bytes_written = 0
+        self._chunk_q: queue.Queue = queue.Queue()
+        
         # 저장 폴더 생성
         os.makedirs(save_dir, exist_ok=True)
     
     def start_recording(self) -> Optional[str]:
         """음성 녹음 시작. 저장될 파일 경로 반환."""
-        if not PYAUDIO_AVAILABLE:
-            print("PyAudio not available. Cannot record audio.")
+        if not AUDIO_RECORDING_AVAILABLE:
+            print("Audio backend not available. Cannot record audio.")
             return None
         
         if self.is_recording:
@@ -153,8 +255,10 @@ class AudioRecorder:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._current_file = os.path.join(self.save_dir, f"voice_memo_{timestamp}.wav")
         
+        if not self._open_wav():
+            return None
+        
         self.is_recording = True
-        self._frames = []
         self._record_thread = threading.Thread(target=self._record_loop, daemon=True)
         self._record_thread.start()
         
@@ -163,57 +267,190 @@ class AudioRecorder:
     
     def stop_recording(self) -> Optional[str]:
         """음성 녹음 중지. 저장된 파일 경로 반환."""
-        if not self.is_recording:
+        if not self.is_recording and self._wf is None:
             return None
         
         self.is_recording = False
         if self._record_thread:
             self._record_thread.join(timeout=2)
         
-        # WAV 파일 저장
-        if self._frames and self._current_file:
-            self._save_wav()
+        # WAV 파일 마무리
+        if self._close_wav():
             print(f"Audio saved: {self._current_file}")
             return self._current_file
         
         return None
     
+    def _queue_chunk(self, data):
+        """수신한 오디오를 풀 버퍼에 담아 기록 스레드로 전달"""
+        buf = _CHUNK_POOL.acquire()
+        buf[:] = data
+        self._chunk_q.put(buf)
+    
+    def _on_sd_audio(self, indata, frames, time_info, status):
+        """sounddevice 콜백: indata는 콜백 동안만 유효한 버퍼"""
+        self._queue_chunk(indata)
+    
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PyAudio 콜백"""
+        self._queue_chunk(in_data)
+        return (None, pyaudio.paContinue)
+    
+    def _write_chunk(self, buf: bytearray):
+        """청크를 WAV 파일에 기록하고 버퍼 반환"""
+        self._wf.writeframesraw(buf)
+        self._bytes_written += len(buf)
+        _CHUNK_POOL.release(buf)
+    
     def _record_loop(self):
         """백그라운드에서 오디오 녹음"""
         try:
-            audio = pyaudio.PyAudio()
-            stream = audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.rate,
-                input=True,
-                frames_per_buffer=self.chunk
-            )
-            
-            while self.is_recording:
-                data = stream.read(self.chunk, exception_on_overflow=False)
-                self._frames.append(data)
+            if SOUNDDEVICE_AVAILABLE:
+                try:
+                    self._record_sounddevice()
+                except sd.PortAudioError as e:
+                    # 입력 장치가 없거나 사용 중이면 PyAudio로 다시 시도
+                    if not PYAUDIO_AVAILABLE:
+                        raise
+                    print(f"sounddevice error: {e} (falling back to PyAudio)")
+                    self._record_pyaudio()
+            else:
+                self._record_pyaudio()
             
-            stream.stop_stream()
-            stream.close()
-            audio.terminate()
+            # 남은 청크 기록
+            while not self._chunk_q.empty():
+                self._write_chunk(self._chunk_q.get_nowait())
             
         except Exception as e:
             print(f"Audio recording error: {e}")
             self.is_recording = False
     
-    def _save_wav(self):
-        """녹음된 오디오를 WAV 파일로 저장"""
+    def _write_while_recording(self, is_active: Callable[[], bool]):
+        """녹음 중인 동안 콜백이 넘긴 청크를 WAV 파일에 기록"""
+        while self.is_recording and is_active():
+            try:
+                buf = self._chunk_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self._write_chunk(buf)
+    
+    def _record_sounddevice(self):
+        """sounddevice RawInputStream으로 녹음"""
+        stream = sd.RawInputStream(
+            samplerate=self.rate,
+            channels=self.channels,
+            dtype=self.dtype,
+            blocksize=self.chunk,
+            callback=self._on_sd_audio
+        )
+        with stream:
+            self._write_while_recording(lambda: stream.active)
+    
+    def _record_pyaudio(self):
+        """PyAudio 콜백 모드로 녹음"""
+        audio = _get_pyaudio()
+        # 콜백 모드: 읽기는 PortAudio 스레드에서 처리
+        stream = audio.open(
+            format=self.format,
+            channels=self.channels,
+            rate=self.rate,
+            input=True,
+            frames_per_buffer=self.chunk,
+            stream_callback=self._on_audio,
+            start=False
+        )
+        stream.start_stream()
+        
+        self._write_while_recording(stream.is_active)
+        
+        stream.stop_stream()
+        stream.close()
+    
+    def _open_wav(self) -> bool:
+        """WAV 파일을 열고 헤더 정보 설정"""
         try:
-            audio = pyaudio.PyAudio()
-            with wave.open(self._current_file, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(audio.get_sample_size(self.format))
-                wf.setframerate(self.rate)
-                wf.writeframes(b''.join(self._frames))
-            audio.terminate()
+            self._wf = wave.open(self._current_file, 'wb')
+            self._wf.setnchannels(self.channels)
+            self._wf.setsampwidth(self.sample_width)
+            self._wf.setframerate(self.rate)
+            self._bytes_written = 0
+            return True
+        except Exception as e:
+            print(f"Error opening WAV: {e}")
+            self._wf = None
+            return False
+    
+    def _close_wav(self) -> bool:
+        """WAV 파일 닫기 (헤더 갱신). 기록된 오디오가 없으면 파일 삭제."""
+        if self._wf is None:
+            return False
+        
+        try:
+            self._wf.close()
         except Exception as e:
             print(f"Error saving WAV: {e}")
+            return False
+        finally:
+            self._wf = None
+        
+        if not self._bytes_written:
+            try:
+                os.remove(self._current_file)
+            except OSError:
+                pass
+            return False
+        return True
+
+
+def _detect_hw_encoder() -> Optional[Tuple[str, str]]:
+    """실제로 동작하는 GPU H.264 인코더의 (ffmpeg 경로, 인코더 이름) 반환 (없으면 None)"""
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return None
+    
+    # 배포판 ffmpeg는 GPU/드라이버가 없어도 h264_nvenc를 목록에 표시하므로
+    # 프레임 하나를 실제로 인코딩해 확인
+    cmd = [ffmpeg, "-hide_banner", "-loglevel", "error",
+           "-f", "lavfi", "-i", "nullsrc=s=256x256", "-frames:v", "1",
+           "-c:v", "h264_nvenc", "-f", "null", "-"]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    if result.returncode == 0:
+        return ffmpeg, "h264_nvenc"
+    return None
+
+
+# GPU 인코더 확인 결과 (확인에 수 초가 걸릴 수 있어 백그라운드에서 한 번만 실행)
+_HW_ENCODER: Optional[Tuple[str, str]] = None
+_HW_ENCODER_READY = threading.Event()
+_HW_ENCODER_LOCK = threading.Lock()
+_hw_encoder_thread: Optional[threading.Thread] = None
+
+
+def _probe_hw_encoder():
+    """백그라운드 스레드: GPU 인코더 확인 후 결과 저장"""
+    global _HW_ENCODER
+    _HW_ENCODER = _detect_hw_encoder()
+    _HW_ENCODER_READY.set()
+
+
+def warm_up_hw_encoder():
+    """GPU 인코더 확인을 백그라운드에서 시작 (이미 시작했으면 무시)"""
+    global _hw_encoder_thread
+    with _HW_ENCODER_LOCK:
+        if _hw_encoder_thread is None:
+            _hw_encoder_thread = threading.Thread(target=_probe_hw_encoder, daemon=True)
+            _hw_encoder_thread.start()
+
+
+def _get_hw_encoder() -> Optional[Tuple[str, str]]:
+    """확인이 끝난 GPU 인코더 반환 (확인 중이면 기다리지 않고 None)"""
+    warm_up_hw_encoder()
+    return _HW_ENCODER if _HW_ENCODER_READY.is_set() else None
 
 
 class VideoRecorder:
@@ -224,8 +461,22 @@ class VideoRecorder:
         self.is_recording = False
         self._current_file: Optional[str] = None
         self._video_writer: Optional[cv2.VideoWriter] = None
+        self._ffmpeg_proc: Optional[subprocess.Popen] = None
+        self._fallback_file: Optional[str] = None  # ffmpeg 중단 후 이어서 기록한 파일
         self._audio_recorder: Optional[AudioRecorder] = None
         
+        # 인코더 스레드 (호출 스레드가 인코딩으로 막히지 않도록)
+        # 프레임 버퍼는 미리 할당해 두고 _free_q <-> _enc_q 사이에서 돌려 씀
+        self._free_q: Optional[queue.Queue] = None
+        self._enc_q: Optional[queue.Queue] = None
+        self._enc_thread: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        
+        # 크기 조정 여부/보간 방식 (첫 프레임에서 결정)
+        self._needs_resize: Optional[bool] = None
+        self._input_shape: Optional[tuple] = None
+        self._interpolation = cv2.INTER_LINEAR
+        
         # 비디오 설정
         self.fps = 30.0
         self.frame_size = (640, 480)
@@ -241,47 +492,177 @@ class VideoRecorder:
         
         if frame_size:
             self.frame_size = frame_size
+        self._needs_resize = None
         
         # 파일명 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._current_file = os.path.join(self.save_dir, f"video_memo_{timestamp}.mp4")
+        self._fallback_file = None
         
-        # VideoWriter 초기화
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self._video_writer = cv2.VideoWriter(
-            self._current_file,
-            fourcc,
-            self.fps,
-            self.frame_size
-        )
+        # GPU 인코더가 있으면 ffmpeg로, 없으면 VideoWriter(mp4v)로 인코딩
+        hw_encoder = _get_hw_encoder()
+        if hw_encoder:
+            self._ffmpeg_proc = self._start_ffmpeg(*hw_encoder)
+        
+        if self._ffmpeg_proc is None:
+            self._open_video_writer()
+        
+        width, height = self.frame_size
+        self._free_q = queue.Queue()
+        for _ in range(8):
+            self._free_q.put(np.empty((height, width, 3), dtype=np.uint8))
+        self._enc_q = queue.Queue()
+        self._enc_thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self._enc_thread.start()
         
         # 오디오 녹음도 시작 (별도 파일로)
         audio_file = self._current_file.replace('.mp4', '_audio.wav')
         self._audio_recorder = AudioRecorder(self.save_dir)
         self._audio_recorder._current_file = audio_file
-        if PYAUDIO_AVAILABLE:
+        if AUDIO_RECORDING_AVAILABLE:
             self._audio_recorder.start_recording()
         
         self.is_recording = True
         print(f"Video recording started: {self._current_file}")
         return self._current_file
     
-    def write_frame(self, frame: np.ndarray):
-        """프레임 기록"""
-        if self.is_recording and self._video_writer:
-            # 프레임 크기 조정
-            if frame.shape[1] != self.frame_size[0] or frame.shape[0] != self.frame_size[1]:
-                frame = cv2.resize(frame, self.frame_size)
+    def _open_video_writer(self, filepath: Optional[str] = None):
+        """OpenCV VideoWriter(mp4v)로 인코딩 준비"""
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        self._video_writer = cv2.VideoWriter(
+            filepath or self._current_file,
+            fourcc,
+            self.fps,
+            self.frame_size
+        )
+    
+    def _start_ffmpeg(self, ffmpeg: str, encoder: str) -> Optional[subprocess.Popen]:
+        """원시 BGR 프레임을 stdin으로 받는 ffmpeg 인코더 프로세스 시작"""
+        width, height = self.frame_size
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(self.fps),
+            "-i", "-",
+            "-c:v", encoder, "-preset", "p1", "-pix_fmt", "yuv420p",
+            self._current_file
+        ]
+        try:
+            return subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"ffmpeg encoder error: {e}")
+            return None
+    
+    def _encode(self, frame: np.ndarray):
+        """프레임 하나를 인코더에 전달"""
+        if self._ffmpeg_proc:
+            try:
+                # 연속 버퍼를 복사 없이 전달
+                self._ffmpeg_proc.stdin.write(memoryview(frame))
+                return
+            except (BrokenPipeError, OSError) as e:
+                # 녹화 중 ffmpeg가 종료되면 이후 프레임은 VideoWriter로 기록
+                # (ffmpeg가 이미 기록한 내용은 보존하고 새 파일에 이어서 기록)
+                self._close_ffmpeg()
+                try:
+                    has_output = os.path.getsize(self._current_file) > 0
+                except OSError:
+                    has_output = False
+                if has_output:
+                    self._fallback_file = self._current_file.replace('.mp4', '_cont.mp4')
+                print(f"ffmpeg encoder error: {e} (falling back to VideoWriter"
+                      f"{': ' + self._fallback_file if self._fallback_file else ''})")
+                self._open_video_writer(self._fallback_file)
+        if self._video_writer:
             self._video_writer.write(frame)
     
+    def _close_ffmpeg(self):
+        """ffmpeg 입력을 닫고 인코딩 완료 대기"""
+        try:
+            self._ffmpeg_proc.stdin.close()
+        except OSError:
+            pass
+        self._ffmpeg_proc.wait()
+        self._ffmpeg_proc = None
+    
+    def _encode_loop(self):
+        """큐에 쌓인 프레임을 순서대로 인코딩 (None 수신 시 종료)"""
+        while True:
+            buf = self._enc_q.get()
+            if buf is None:
+                break
+            try:
+                self._encode(buf)
+            except (cv2.error, OSError) as e:
+                print(f"Video encoding error: {e}")
+            finally:
+                self._free_q.put(buf)
+    
+    def _choose_resize(self, frame: np.ndarray):
+        """입력 프레임 크기에 맞춰 크기 조정 여부와 보간 방식 결정"""
+        height, width = frame.shape[:2]
+        self._needs_resize = (width, height) != tuple(self.frame_size)
+        if not self._needs_resize:
+            return
+        
+        ratio = min(self.frame_size[0] / width, self.frame_size[1] / height)
+        if ratio < 0.9:
+            self._interpolation = cv2.INTER_AREA  # 축소
+        elif ratio <= 1.1:
+            self._interpolation = cv2.INTER_NEAREST  # 미세 조정
+        else:
+            self._interpolation = cv2.INTER_LINEAR  # 확대
+    
+    def write_frame(self, frame: np.ndarray):
+        """프레임 기록 (인코더 스레드로 전달)"""
+        with self._write_lock:
+            if not self.is_recording or self._enc_q is None:
+                return
+            
+            # 입력 크기가 바뀌면 크기 조정 방식을 다시 결정
+            if self._needs_resize is None or frame.shape[:2] != self._input_shape:
+                self._input_shape = frame.shape[:2]
+                self._choose_resize(frame)
+            
+            # 빈 버퍼가 없으면 인코더가 따라올 때까지 잠시 대기 (계속 밀리면 프레임 버림)
+            try:
+                buf = self._free_q.get(timeout=0.5)
+            except queue.Empty:
+                return
+            
+            # 프레임 크기 조정 (호출자가 버퍼를 재사용할 수 있으므로 그 외에는 복사)
+            try:
+                if self._needs_resize:
+                    cv2.resize(frame, self.frame_size, dst=buf, interpolation=self._interpolation)
+                else:
+                    np.copyto(buf, frame)
+            except (cv2.error, ValueError) as e:
+                print(f"Video frame error: {e}")
+                self._free_q.put(buf)
+                return
+            
+            self._enc_q.put(buf)
+    
     def stop_recording(self) -> Optional[str]:
         """영상 녹화 중지. 저장된 파일 경로 반환."""
-        if not self.is_recording:
-            return None
+        with self._write_lock:
+            if not self.is_recording:
+                return None
+            self.is_recording = False
         
-        self.is_recording = False
+        # 남은 프레임 인코딩 후 인코더 스레드 종료
+        if self._enc_thread:
+            self._enc_q.put(None)
+            self._enc_thread.join()
+            self._enc_thread = None
+            self._enc_q = None
+            self._free_q = None
         
         # 비디오 저장
+        if self._ffmpeg_proc:
+            self._close_ffmpeg()
         if self._video_writer:
             self._video_writer.release()
             self._video_writer = None
@@ -291,58 +672,86 @@ class VideoRecorder:
             self._audio_recorder.stop_recording()
             self._audio_recorder = None
         
-        print(f"Video saved: {self._current_file}")
+        if self._fallback_file:
+            print(f"Video saved: {self._current_file} (continued in {self._fallback_file})")
+        else:
+            print(f"Video saved: {self._current_file}")
         return self._current_file
 
 
+# 메모 파일명의 타임스탬프 (예: voice_memo_20260130_103657.wav)
+_TIMESTAMP_RE = re.compile(r'_(\d{8})_(\d{6})\.(?:wav|mp4)$')
+
+
 class MemoManager:
     """메모 파일 관리 클래스"""
     
     def __init__(self, memo_dir: str = "memos"):
         self.memo_dir = memo_dir
         os.makedirs(memo_dir, exist_ok=True)
+        
+        # 메모 목록 캐시 (폴더 수정 시각 기준으로 무효화)
+        self._cache: Optional[List[dict]] = None
+        self._cache_mtime = 0
     
     def get_all_memos(self) -> List[dict]:
         """모든 메모 목록 반환"""
-        memos = []
+        try:
+            dir_mtime = os.stat(self.memo_dir).st_mtime_ns
+        except OSError:
+            return []
         
-        if not os.path.exists(self.memo_dir):
-            return memos
+        if self._cache is not None and dir_mtime == self._cache_mtime:
+            return list(self._cache)
         
-        for filename in os.listdir(self.memo_dir):
-            filepath = os.path.join(self.memo_dir, filename)
-            if not os.path.isfile(filepath):
-                continue
-            
-            # 오디오 파일 제외 (영상의 오디오 트랙)
-            if "_audio.wav" in filename:
-                continue
-            
-            memo_type = None
-            if filename.startswith("voice_memo") and filename.endswith(".wav"):
-                memo_type = "voice"
-            elif filename.startswith("video_memo") and filename.endswith(".mp4"):
-                memo_type = "video"
-            
-            if memo_type:
-                # 파일명에서 타임스탬프 추출
-                try:
-                    timestamp_str = filename.split("_")[2] + "_" + filename.split("_")[3].split(".")[0]
-                    timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                except (IndexError, ValueError):
-                    timestamp = datetime.fromtimestamp(os.path.getmtime(filepath))
+        memos = []
+        with os.scandir(self.memo_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                
+                filename = entry.name
+                
+                # 오디오 파일 제외 (영상의 오디오 트랙)
+                if "_audio.wav" in filename:
+                    continue
                 
-                memos.append({
-                    "filename": filename,
-                    "filepath": filepath,
-                    "type": memo_type,
-                    "timestamp": timestamp,
-                    "size": os.path.getsize(filepath)
-                })
+                memo_type = None
+                if filename.startswith("voice_memo") and filename.endswith(".wav"):
+                    memo_type = "voice"
+                elif filename.startswith("video_memo") and filename.endswith(".mp4"):
+                    memo_type = "video"
+                
+                if memo_type:
+                    stat = entry.stat()
+                    
+                    # 파일명에서 타임스탬프 추출
+                    timestamp = None
+                    match = _TIMESTAMP_RE.search(filename)
+                    if match:
+                        d, t = match.group(1), match.group(2)
+                        try:
+                            timestamp = datetime(int(d[:4]), int(d[4:6]), int(d[6:8]),
+                                                 int(t[:2]), int(t[2:4]), int(t[4:6]))
+                        except ValueError:
+                            pass
+                    if timestamp is None:
+                        timestamp = datetime.fromtimestamp(stat.st_mtime)
+                    
+                    memos.append({
+                        "filename": filename,
+                        "filepath": entry.path,
+                        "type": memo_type,
+                        "timestamp": timestamp,
+                        "size": stat.st_size
+                    })
         
         # 최신순 정렬
         memos.sort(key=lambda x: x["timestamp"], reverse=True)
-        return memos
+        
+        self._cache = memos
+        self._cache_mtime = dir_mtime
+        return list(memos)
     
     def delete_memo(self, filepath: str) -> bool:
         """메모 삭제"""
@@ -355,19 +764,35 @@ class MemoManager:
                 if os.path.exists(audio_path):
                     os.remove(audio_path)
                 
+                self.clear_cache()
                 print(f"Memo deleted: {filepath}")
                 return True
         except Exception as e:
             print(f"Error deleting memo: {e}")
         return False
     
-    def get_memo_count(self) -> dict:
-        """메모 개수 반환"""
+    def clear_cache(self):
+        """목록 캐시 비우기 (녹음 중이던 파일 크기 등 폴더 시각에 안 잡히는 변경 반영)"""
+        self._cache = None
+    
+    def get_summary(self) -> dict:
+        """메모 목록과 개수를 한 번의 조회로 반환"""
         memos = self.get_all_memos()
+        voice = sum(1 for m in memos if m["type"] == "voice")
         return {
+            "list": memos,
             "total": len(memos),
-            "voice": sum(1 for m in memos if m["type"] == "voice"),
-            "video": sum(1 for m in memos if m["type"] == "video")
+            "voice": voice,
+            "video": len(memos) - voice
+        }
+    
+    def get_memo_count(self) -> dict:
+        """메모 개수 반환"""
+        summary = self.get_summary()
+        return {
+            "total": summary["total"],
+            "voice": summary["voice"],
+            "video": summary["video"]
         }
 
 
@@ -399,6 +824,8 @@ class SmartMirrorMemo:
     def start(self):
         """메모 시스템 시작 (음성 명령 대기)"""
         self.is_active = True
+        # 첫 영상 메모가 인코더 확인을 기다리지 않도록 미리 시작
+        warm_up_hw_encoder()
         self.voice_recognizer.start_listening()
         print("Smart Mirror Memo system started.")
     
@@ -494,6 +921,7 @@ class SmartMirrorMemo:
 if __name__ == "__main__":
     print("=== Smart Mirror Memo Module Test ===")
     print(f"Speech Recognition: {'Available' if SPEECH_RECOGNITION_AVAILABLE else 'Not Available'}")
+    print(f"sounddevice: {'Available' if SOUNDDEVICE_AVAILABLE else 'Not Available'}")
     print(f"PyAudio: {'Available' if PYAUDIO_AVAILABLE else 'Not Available'}")
     
     memo = SmartMirrorMemo()
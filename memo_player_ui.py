@@ -6,18 +6,26 @@
 """
 
 import os
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+import queue
 import threading
+import time
+import wave
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
 
 # 오디오 재생
 try:
     import pygame
-    pygame.mixer.init()
+    if not pygame.mixer.get_init():
+        # 버퍼를 넉넉히 잡아 CPU 부하 시 끊김 방지 (~93ms 지연, 메모 재생엔 무방)
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=4096)
+        pygame.mixer.init()
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
@@ -26,6 +34,99 @@ except ImportError:
 # 메모 모듈
 from memo_module import MemoManager
 
+# 영상 재생 최대 크기
+VIDEO_MAX_SIZE = (640, 480)
+
+# 메모 목록 한 줄 높이 (아이템 + 위아래 여백)와 화면 밖에 미리 배치할 줄 수
+MEMO_ITEM_HEIGHT = 86
+MEMO_OVERSCAN = 2
+
+# 디코딩 스레드와 표시 사이에 미리 준비해 둘 프레임 수
+VIDEO_QUEUE_SIZE = 4
+
+# 목록 아이콘 자리에 표시할 영상 썸네일 크기와 미리 만들어 둘 개수 (최신순)
+THUMB_SIZE = (64, 48)
+THUMB_PREFETCH_COUNT = 8
+
+# 메모 종류별 아이콘/이름
+_TYPE_ICONS = {"voice": "🎤", "video": "🎥"}
+_TYPE_TEXTS = {"voice": "음성 메모", "video": "영상 메모"}
+
+
+def _detect_jetson_gstreamer() -> bool:
+    """Jetson + GStreamer 지원 OpenCV 빌드인지 확인 (임포트 시 한 번만)"""
+    if not os.path.exists("/etc/nv_tegra_release"):
+        return False
+    try:
+        info = cv2.getBuildInformation()
+    except cv2.error:
+        return False
+    return re.search(r"GStreamer:\s+YES", info) is not None
+
+
+# Jetson이면 nvv4l2decoder 하드웨어 디코더 파이프라인 사용
+USE_JETSON_GSTREAMER = _detect_jetson_gstreamer()
+
+# FFmpeg VideoCapture를 열 때 넘길 설정 (OpenCV 빌드가 지원하는 것만)
+_DECODE_THREADS = os.cpu_count() or 4
+_CAPTURE_PARAMS: List[int] = []
+if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+    _CAPTURE_PARAMS += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+if hasattr(cv2, "CAP_PROP_N_THREADS"):
+    _CAPTURE_PARAMS += [cv2.CAP_PROP_N_THREADS, _DECODE_THREADS]
+else:
+    # CAP_PROP_N_THREADS가 없는 빌드는 환경 변수로 지정 (임포트 시 한 번만)
+    os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", f"threads;{_DECODE_THREADS}")
+
+
+def _open_video_capture(filepath: str) -> cv2.VideoCapture:
+    """하드웨어 디코딩(가능 시)과 멀티스레드 디코딩을 켠 VideoCapture 열기"""
+    if USE_JETSON_GSTREAMER:
+        pipeline = (f'filesrc location="{filepath}" ! qtdemux ! parsebin ! '
+                    "nvv4l2decoder ! nvvidconv ! video/x-raw,format=BGRx ! "
+                    "videoconvert ! video/x-raw,format=BGR ! appsink")
+        cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        if cap.isOpened():
+            return cap
+    
+    cap = None
+    if _CAPTURE_PARAMS:
+        # 하드웨어 가속/스레드 수는 열 때만 지정 가능 (가속이 안 되면 CPU 디코딩으로 동작)
+        try:
+            cap = cv2.VideoCapture(filepath, cv2.CAP_FFMPEG, _CAPTURE_PARAMS)
+        except cv2.error:
+            cap = None
+    if cap is None or not cap.isOpened():
+        cap = cv2.VideoCapture(filepath, cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        # FFmpeg 백엔드가 없는 빌드는 기본 백엔드로 다시 시도
+        cap = cv2.VideoCapture(filepath)
+    return cap
+
+
+def _audio_length(filepath: str) -> float:
+    """오디오 파일 길이(초) 반환 (WAV는 헤더만 읽음)"""
+    try:
+        with wave.open(filepath, 'rb') as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except (wave.Error, EOFError, OSError, ZeroDivisionError):
+        return pygame.mixer.Sound(filepath).get_length()
+
+
+def _fmt_size(size: int) -> str:
+    """파일 크기를 KB/MB 문자열로 변환"""
+    if size > 1024 * 1024:
+        return f"{size / 1048576:.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def _fit_size(width: int, height: int, max_size: tuple) -> tuple:
+    """비율을 유지하며 max_size 안에 들어가는 크기 반환 (확대하지 않음)"""
+    if width <= 0 or height <= 0:
+        return max_size
+    scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
 
 class MemoPlayerUI:
     """메모 재생 UI 클래스"""
@@ -48,6 +149,15 @@ class MemoPlayerUI:
         # 스타일 설정
         self._setup_styles()
         
+        # 메모 목록 (보이는 영역의 아이템 위젯만 만들어 재사용)
+        self._memos: List[dict] = []
+        self._item_pool: List[dict] = []
+        self._thumbs: Dict[str, ImageTk.PhotoImage] = {}
+        self._prefetching = False
+        self._dir_mtime: Optional[int] = None
+        self._wheel_accum = 0
+        self._wheel_pending = False
+        
         # UI 구성
         self._create_widgets()
         
@@ -56,7 +166,11 @@ class MemoPlayerUI:
         
         # 재생 상태
         self._is_playing_audio = False
+        self._audio_end_job: Optional[str] = None
         self._video_window: Optional[tk.Toplevel] = None
+        self._video_stop = threading.Event()
+        self._video_photo: Optional[ImageTk.PhotoImage] = None
+        self._video_pil: Optional[Image.Image] = None
     
     def _setup_styles(self):
         """UI 스타일 설정"""
@@ -97,7 +211,7 @@ class MemoPlayerUI:
         
         # 새로고침 버튼
         refresh_btn = tk.Button(header_frame, text="🔄", 
-                               command=self.refresh_memos,
+                               command=lambda: self.refresh_memos(force=True),
                                bg="#16213e", fg="white",
                                font=("맑은 고딕", 14),
                                bd=0, padx=10, pady=5)
@@ -113,87 +227,204 @@ class MemoPlayerUI:
         
         # 캔버스 + 스크롤바
         self.canvas = tk.Canvas(list_frame, bg="#1a1a2e", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.canvas.yview)
+        self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.canvas.yview)
         
-        self.memo_list_frame = ttk.Frame(self.canvas, style="Dark.TFrame")
+        # 스크롤 위치가 바뀔 때마다 보이는 아이템 다시 배치
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
         
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.memo_list_frame, anchor="nw")
+        # 메모가 없을 때 안내
+        no_memo_label = tk.Label(self.canvas,
+                                text="저장된 메모가 없습니다.\n\n음성 명령으로 메모를 추가하세요:\n• \"음성 메모\"\n• \"영상 메모\"",
+                                bg="#1a1a2e", fg="#666",
+                                font=("맑은 고딕", 12),
+                                justify=tk.CENTER)
+        self._no_memo_window = self.canvas.create_window((0, 50), window=no_memo_label,
+                                                         anchor="n", state="hidden")
         
-        # 스크롤 영역 업데이트
-        self.memo_list_frame.bind("<Configure>", self._on_frame_configure)
+        # 캔버스 크기 변경
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
-        # 마우스 휠 스크롤
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # 마우스 휠 스크롤 (포인터가 목록 위에 있을 때만 전역 바인딩)
+        self.canvas.bind("<Enter>", self._on_canvas_enter)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
     
-    def _on_frame_configure(self, event):
-        """프레임 크기 변경 시 스크롤 영역 업데이트"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _on_canvas_scroll(self, first, last):
+        """캔버스 스크롤 시 스크롤바 갱신 후 보이는 아이템 배치"""
+        self.scrollbar.set(first, last)
+        self._layout_items()
     
     def _on_canvas_configure(self, event):
-        """캔버스 크기 변경 시 내부 프레임 너비 조정"""
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        """캔버스 크기 변경 시 아이템 너비 조정"""
+        for slot in self._item_pool:
+            self.canvas.itemconfig(slot["window"], width=event.width - 10)
+        self.canvas.coords(self._no_memo_window, event.width // 2, 50)
+        self._layout_items()
+    
+    def _on_canvas_enter(self, event):
+        """목록에 포인터가 들어오면 휠 스크롤 활성화"""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _on_canvas_leave(self, event):
+        """목록 밖으로 나가면 휠 스크롤 해제 (아이템 위젯으로 옮겨간 경우는 유지)"""
+        widget = self.canvas.winfo_containing(*self.canvas.winfo_pointerxy())
+        canvas_path = str(self.canvas)
+        if widget is not None and (str(widget) == canvas_path or
+                                   str(widget).startswith(canvas_path + ".")):
+            return
+        self.canvas.unbind_all("<MouseWheel>")
     
     def _on_mousewheel(self, event):
-        """마우스 휠 스크롤"""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        """마우스 휠 스크롤 (16ms 동안 모아서 한 번에 적용)"""
+        self._wheel_accum -= event.delta
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after(16, self._flush_wheel)
     
-    def refresh_memos(self):
-        """메모 목록 새로고침"""
-        # 기존 위젯 삭제
-        for widget in self.memo_list_frame.winfo_children():
-            widget.destroy()
-        
-        # 메모 목록 가져오기
-        memos = self.memo_manager.get_all_memos()
-        counts = self.memo_manager.get_memo_count()
+    def _flush_wheel(self):
+        """모아둔 휠 이동량을 한 번에 스크롤"""
+        self._wheel_pending = False
+        units = int(self._wheel_accum / 120)
+        # 한 칸이 안 되는 나머지는 다음 휠 입력에 합산 (고해상도 트랙패드)
+        self._wheel_accum -= units * 120
+        if units:
+            self.canvas.yview_scroll(units, "units")
+    
+    def refresh_memos(self, force: bool = False):
+        """메모 목록 새로고침 (force=True면 캐시를 무시하고 다시 읽음)"""
+        if force:
+            self._dir_mtime = None
+            self.memo_manager.clear_cache()
         
-        # 개수 표시 업데이트
-        self.count_label.config(text=f"🎤 {counts['voice']} | 🎥 {counts['video']}")
-        
-        if not memos:
-            no_memo_label = tk.Label(self.memo_list_frame,
-                                    text="저장된 메모가 없습니다.\n\n음성 명령으로 메모를 추가하세요:\n• \"음성 메모\"\n• \"영상 메모\"",
-                                    bg="#1a1a2e", fg="#666",
-                                    font=("맑은 고딕", 12),
-                                    justify=tk.CENTER)
-            no_memo_label.pack(pady=50)
+        # 폴더가 바뀌지 않았으면 목록을 다시 그리지 않음
+        try:
+            dir_mtime = os.stat(self.memo_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and dir_mtime == self._dir_mtime:
             return
+        self._dir_mtime = dir_mtime
         
-        # 메모 아이템 생성
-        for memo in memos:
-            self._create_memo_item(memo)
-    
-    def _create_memo_item(self, memo: dict):
-        """메모 아이템 위젯 생성"""
-        # 아이템 프레임
-        item_frame = tk.Frame(self.memo_list_frame, bg="#16213e", padx=15, pady=12)
-        item_frame.pack(fill=tk.X, pady=5, padx=5)
+        # 메모 목록/개수 가져오기 (폴더는 한 번만 조회)
+        summary = self.memo_manager.get_summary()
+        self._memos = summary["list"]
         
-        # 아이콘 + 정보
-        icon = "🎤" if memo["type"] == "voice" else "🎥"
-        type_text = "음성 메모" if memo["type"] == "voice" else "영상 메모"
+        # 개수 표시 업데이트
+        self.count_label.config(text=f"🎤 {summary['voice']} | 🎥 {summary['video']}")
+        
+        # 전체 높이만 스크롤 영역으로 설정 (아이템 위젯은 보이는 만큼만 존재)
+        self.canvas.itemconfig(self._no_memo_window,
+                               state="hidden" if self._memos else "normal")
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(),
+                                            len(self._memos) * MEMO_ITEM_HEIGHT))
+        self._layout_items()
+        
+        # 영상 썸네일은 백그라운드에서 미리 생성
+        if not self._prefetching:
+            pending = [m["filepath"] for m in self._memos if m["type"] == "video"]
+            pending = [fp for fp in pending[:THUMB_PREFETCH_COUNT] if fp not in self._thumbs]
+            if pending:
+                self._prefetching = True
+                threading.Thread(target=self._prefetch_thumbs, args=(pending,),
+                                 daemon=True).start()
+    
+    def _prefetch_thumbs(self, filepaths: List[str]):
+        """백그라운드 스레드: 영상 첫 프레임으로 썸네일 생성"""
+        try:
+            for filepath in filepaths:
+                cap = cv2.VideoCapture(filepath)
+                ret, frame = cap.read()
+                cap.release()
+                if not ret:
+                    continue
+                
+                size = _fit_size(frame.shape[1], frame.shape[0], THUMB_SIZE)
+                small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                img = Image.fromarray(cv2.cvtColor(small, cv2.COLOR_BGR2RGB))
+                
+                # PhotoImage는 메인 스레드에서 생성
+                self.root.after(0, lambda fp=filepath, im=img: self._attach_thumb(fp, im))
+        except (RuntimeError, tk.TclError):
+            pass  # 창이 이미 닫힘
+        except cv2.error as e:
+            print(f"Thumbnail error: {e}")
+        finally:
+            # 어떤 경우에도 다음 새로고침에서 다시 생성할 수 있게 함
+            try:
+                self.root.after(0, self._on_prefetch_done)
+            except (RuntimeError, tk.TclError):
+                self._prefetching = False
+    
+    def _on_prefetch_done(self):
+        """썸네일 생성 완료 (다음 새로고침 때 새 영상 메모 처리)"""
+        self._prefetching = False
+    
+    def _attach_thumb(self, filepath: str, img: Image.Image):
+        """썸네일 저장 후 해당 메모를 표시 중인 아이템에 반영"""
+        self._thumbs[filepath] = ImageTk.PhotoImage(img)
+        for slot in self._item_pool:
+            if slot["memo"] is not None and slot["memo"]["filepath"] == filepath:
+                self._fill_memo_item(slot, slot["memo"])
+    
+    def _layout_items(self):
+        """보이는 행에만 아이템 위젯을 배치하고 나머지는 숨김"""
+        memos = self._memos
+        first = int(self.canvas.canvasy(0) // MEMO_ITEM_HEIGHT)
+        count = self.canvas.winfo_height() // MEMO_ITEM_HEIGHT + 2 + MEMO_OVERSCAN
+        
+        while len(self._item_pool) < count:
+            self._item_pool.append(self._create_memo_item())
+        
+        for k, slot in enumerate(self._item_pool):
+            i = first + k
+            if k < count and i < len(memos):
+                if slot["memo"] is not memos[i]:
+                    self._fill_memo_item(slot, memos[i])
+                self.canvas.coords(slot["window"], 5, i * MEMO_ITEM_HEIGHT + 5)
+                self.canvas.itemconfig(slot["window"], state="normal")
+            elif slot["memo"] is not None:
+                slot["memo"] = None
+                self.canvas.itemconfig(slot["window"], state="hidden")
+    
+    def _format_memo(self, memo: dict):
+        """메모 표시용 문자열 계산 (메모 dict에 캐시)"""
+        if "time_str" in memo:
+            return
         
         # 시간 포맷
-        time_str = memo["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
+        memo["time_str"] = memo["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
         
         # 파일 크기 포맷
-        size_kb = memo["size"] / 1024
-        if size_kb > 1024:
-            size_str = f"{size_kb/1024:.1f} MB"
+        memo["size_str"] = _fmt_size(memo["size"])
+    
+    def _fill_memo_item(self, slot: dict, memo: dict):
+        """재사용 아이템에 메모 내용 표시"""
+        self._format_memo(memo)
+        slot["memo"] = memo
+        
+        # 아이콘 + 정보
+        thumb = self._thumbs.get(memo["filepath"])
+        if thumb is not None:
+            slot["icon"].configure(image=thumb, text="")
         else:
-            size_str = f"{size_kb:.1f} KB"
+            slot["icon"].configure(image="", text=_TYPE_ICONS[memo["type"]])
+        slot["type"].configure(text=_TYPE_TEXTS[memo["type"]])
+        slot["time"].configure(text=memo["time_str"])
+        slot["size"].configure(text=memo["size_str"])
+    
+    def _create_memo_item(self) -> dict:
+        """재사용할 메모 아이템 위젯 생성 (내용은 _fill_memo_item에서 채움)"""
+        # 아이템 프레임
+        item_frame = tk.Frame(self.canvas, bg="#16213e", padx=15, pady=12)
+        slot = {"memo": None, "frame": item_frame}
         
         # 왼쪽 영역 (아이콘 + 정보)
         left_frame = tk.Frame(item_frame, bg="#16213e")
         left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        icon_label = tk.Label(left_frame, text=icon, 
+        icon_label = tk.Label(left_frame,
                              bg="#16213e", fg="white",
                              font=("맑은 고딕", 24))
         icon_label.pack(side=tk.LEFT, padx=(0, 10))
@@ -201,17 +432,17 @@ class MemoPlayerUI:
         info_frame = tk.Frame(left_frame, bg="#16213e")
         info_frame.pack(side=tk.LEFT, fill=tk.X)
         
-        type_label = tk.Label(info_frame, text=type_text,
+        type_label = tk.Label(info_frame,
                              bg="#16213e", fg="white",
                              font=("맑은 고딕", 12, "bold"))
         type_label.pack(anchor=tk.W)
         
-        time_label = tk.Label(info_frame, text=time_str,
+        time_label = tk.Label(info_frame,
                              bg="#16213e", fg="#888",
                              font=("맑은 고딕", 9))
         time_label.pack(anchor=tk.W)
         
-        size_label = tk.Label(info_frame, text=size_str,
+        size_label = tk.Label(info_frame,
                              bg="#16213e", fg="#666",
                              font=("맑은 고딕", 8))
         size_label.pack(anchor=tk.W)
@@ -222,7 +453,7 @@ class MemoPlayerUI:
         
         # 재생 버튼
         play_btn = tk.Button(btn_frame, text="▶",
-                            command=lambda m=memo: self._play_memo(m),
+                            command=lambda: self._play_memo(slot["memo"]),
                             bg="#0f3460", fg="white",
                             font=("맑은 고딕", 14),
                             bd=0, padx=15, pady=8)
@@ -230,35 +461,35 @@ class MemoPlayerUI:
         
         # 삭제 버튼
         delete_btn = tk.Button(btn_frame, text="🗑",
-                              command=lambda m=memo: self._delete_memo(m),
+                              command=lambda: self._delete_memo(slot["memo"]),
                               bg="#e94560", fg="white",
                               font=("맑은 고딕", 12),
                               bd=0, padx=10, pady=8)
         delete_btn.pack(side=tk.LEFT)
         
-        # 호버 효과
+        # 호버 효과 (배경색을 바꿀 위젯은 생성 시 한 번만 수집, 버튼 제외)
+        item_frame._bg_targets = [item_frame, left_frame, info_frame, icon_label,
+                                  type_label, time_label, size_label, btn_frame]
+        
         def on_enter(e):
-            item_frame.configure(bg="#0f3460")
-            for child in item_frame.winfo_children():
-                self._update_bg_recursive(child, "#0f3460")
+            for widget in item_frame._bg_targets:
+                widget.configure(bg="#0f3460")
         
         def on_leave(e):
-            item_frame.configure(bg="#16213e")
-            for child in item_frame.winfo_children():
-                self._update_bg_recursive(child, "#16213e")
+            for widget in item_frame._bg_targets:
+                widget.configure(bg="#16213e")
         
         item_frame.bind("<Enter>", on_enter)
         item_frame.bind("<Leave>", on_leave)
-    
-    def _update_bg_recursive(self, widget, bg_color):
-        """위젯과 자식들의 배경색 업데이트"""
-        try:
-            if isinstance(widget, (tk.Frame, tk.Label)):
-                widget.configure(bg=bg_color)
-            for child in widget.winfo_children():
-                self._update_bg_recursive(child, bg_color)
-        except:
-            pass
+        
+        # 캔버스에 고정 크기 창으로 배치 (위치는 _layout_items에서)
+        slot["window"] = self.canvas.create_window(
+            (5, 5), window=item_frame, anchor="nw", state="hidden",
+            width=max(1, self.canvas.winfo_width() - 10),
+            height=MEMO_ITEM_HEIGHT - 10
+        )
+        slot.update(icon=icon_label, type=type_label, time=time_label, size=size_label)
+        return slot
     
     def _play_memo(self, memo: dict):
         """메모 재생"""
@@ -277,96 +508,227 @@ class MemoPlayerUI:
             if self._is_playing_audio:
                 pygame.mixer.music.stop()
                 self._is_playing_audio = False
+            if self._audio_end_job:
+                self.root.after_cancel(self._audio_end_job)
+                self._audio_end_job = None
             
             pygame.mixer.music.load(filepath)
             pygame.mixer.music.play()
             self._is_playing_audio = True
             
-            # 재생 완료 감지
-            def check_playing():
-                if pygame.mixer.music.get_busy():
-                    self.root.after(100, check_playing)
-                else:
-                    self._is_playing_audio = False
-            
-            check_playing()
+            # 재생 완료 감지 (폴링 대신 재생 길이 뒤에 한 번만 호출)
+            duration_ms = int(_audio_length(filepath) * 1000) + 100
+            self._audio_end_job = self.root.after(duration_ms, self._on_audio_end)
             
         except Exception as e:
             messagebox.showerror("오류", f"오디오 재생 실패: {e}")
     
-    def _play_video(self, filepath: str):
-        """영상 메모 재생"""
+    def _on_audio_end(self):
+        """음성 메모 재생 완료"""
+        self._audio_end_job = None
+        self._is_playing_audio = False
+    
+    def _close_video(self):
+        """영상 재생 중지 (디코딩 스레드가 즉시 멈추고 캡처를 해제함)"""
+        self._video_stop.set()
         if self._video_window:
             self._video_window.destroy()
+            self._video_window = None
+    
+    def _play_video(self, filepath: str):
+        """영상 메모 재생"""
+        # 이전 재생의 디코딩 스레드를 멈추고 창 닫기
+        self._close_video()
         
         # 새 창 생성
         self._video_window = tk.Toplevel(self.root)
         self._video_window.title("🎥 영상 메모 재생")
         self._video_window.configure(bg="black")
         
-        # 비디오 라벨
-        video_label = tk.Label(self._video_window, bg="black")
+        # 비디오 라벨 (디코딩된 첫 프레임이 올 때까지 미리 만든 썸네일 표시)
+        thumb = self._thumbs.get(filepath)
+        video_label = tk.Label(self._video_window, bg="black",
+                               image=thumb if thumb is not None else "")
         video_label.pack()
         
+        # 버튼 영역
+        btn_frame = tk.Frame(self._video_window, bg="black")
+        btn_frame.pack(pady=10)
+        
+        # 10초 건너뛰기 버튼 (디코딩 스레드가 다음 프레임 전에 처리)
+        skip = threading.Event()
+        skip_btn = tk.Button(btn_frame, text="⏩ 10초",
+                            command=skip.set,
+                            bg="#0f3460", fg="white",
+                            font=("맑은 고딕", 12),
+                            bd=0, padx=20, pady=10)
+        skip_btn.pack(side=tk.LEFT, padx=5)
+        
         # 닫기 버튼
-        close_btn = tk.Button(self._video_window, text="✕ 닫기",
-                             command=self._video_window.destroy,
+        close_btn = tk.Button(btn_frame, text="✕ 닫기",
+                             command=self._close_video,
                              bg="#e94560", fg="white",
                              font=("맑은 고딕", 12),
                              bd=0, padx=20, pady=10)
-        close_btn.pack(pady=10)
-        
-        # 비디오 재생 스레드
-        def play_video():
-            cap = cv2.VideoCapture(filepath)
+        close_btn.pack(side=tk.LEFT, padx=5)
+        self._video_window.protocol("WM_DELETE_WINDOW", self._close_video)
+        
+        # 디코딩 스레드 -> 메인 스레드(표시) 프레임 큐
+        # (중지 이벤트는 재생마다 새로 만들어 이전 스레드가 다시 깨어나지 않게 함)
+        frame_q = queue.Queue(maxsize=VIDEO_QUEUE_SIZE)
+        stop = self._video_stop = threading.Event()
+        clock = {"t0": time.perf_counter(), "fps": 30.0}
+        self._video_pil = None
+        self._video_photo = None
+        
+        def put(item) -> bool:
+            """큐에 여유가 생길 때까지 대기 (재생 중지 시 포기)"""
+            while not stop.is_set():
+                try:
+                    frame_q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def decode():
+            """디코딩 스레드: 표시할 프레임을 RGB로 변환해 큐에 넣음"""
+            cap = _open_video_capture(filepath)
             if not cap.isOpened():
-                messagebox.showerror("오류", "영상을 열 수 없습니다.")
+                self.root.after(0, lambda: messagebox.showerror("오류", "영상을 열 수 없습니다."))
+                put(None)
                 return
             
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            delay = int(1000 / fps) if fps > 0 else 33
-            
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            try:
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                if fps <= 0:
+                    fps = 30.0
                 
-                if not self._video_window or not self._video_window.winfo_exists():
-                    break
+                # 출력 크기는 한 번만 계산
+                src_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+                width, height = _fit_size(*src_size, VIDEO_MAX_SIZE)
+                needs_resize = (width, height) != src_size
                 
-                # BGR -> RGB 변환
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # 큐에 있거나 표시 중인 프레임을 덮어쓰지 않도록 버퍼를 돌려 씀
+                buffers = [np.empty((height, width, 3), dtype=np.uint8)
+                           for _ in range(VIDEO_QUEUE_SIZE + 2)]
+                # 크기 조정 결과는 바로 색 변환되므로 하나만 재사용
+                small_buf = np.empty((height, width, 3), dtype=np.uint8) if needs_resize else None
                 
-                # PIL 이미지로 변환
-                img = Image.fromarray(frame_rgb)
+                # OpenCL(Transparent API)을 쓸 수 있으면 크기 조정/색 변환을 GPU에서 처리
+                use_opencl = cv2.ocl.haveOpenCL()
+                if use_opencl:
+                    cv2.ocl.setUseOpenCL(True)
                 
-                # 크기 조정
-                img.thumbnail((640, 480))
+                # 실제 경과 시간 기준으로 재생 (밀리면 디코딩 없이 건너뜀)
+                clock["fps"] = fps
+                clock["t0"] = time.perf_counter()
+                frame_idx = 0
+                decoded = 0
                 
-                # Tkinter 이미지로 변환
-                photo = ImageTk.PhotoImage(image=img)
+                while not stop.is_set():
+                    if skip.is_set():
+                        skip.clear()
+                        # 키프레임 탐색으로 이동 (안 되는 백엔드는 변환 없이 grab만 반복)
+                        skip_frames = int(fps * 10)
+                        if not cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx + skip_frames):
+                            for _ in range(skip_frames):
+                                if stop.is_set() or not cap.grab():
+                                    break
+                        frame_idx += skip_frames
+                        # 재생 시계도 같이 앞당겨 밀린 프레임으로 처리되지 않게 함
+                        clock["t0"] -= skip_frames / fps
+                    
+                    target_idx = int((time.perf_counter() - clock["t0"]) * fps)
+                    ok = True
+                    while frame_idx < target_idx - 1:
+                        ok = cap.grab()
+                        if not ok:
+                            break
+                        frame_idx += 1
+                    if not ok:
+                        break
+                    
+                    if not cap.grab():
+                        break
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    
+                    # 크기 조정 후 BGR -> RGB 변환 (변환할 픽셀 수 감소)
+                    rgb_buf = None
+                    if use_opencl:
+                        try:
+                            umat = cv2.UMat(frame)
+                            if needs_resize:
+                                umat = cv2.resize(umat, (width, height), interpolation=cv2.INTER_NEAREST)
+                            # 마지막 결과만 CPU로 내려받음
+                            rgb_buf = cv2.cvtColor(umat, cv2.COLOR_BGR2RGB).get()
+                        except cv2.error:
+                            use_opencl = False  # OpenCL 실패 시 CPU 경로로 전환
+                    if rgb_buf is None:
+                        rgb_buf = buffers[decoded % len(buffers)]
+                        decoded += 1
+                        if needs_resize:
+                            frame = cv2.resize(frame, (width, height), dst=small_buf,
+                                               interpolation=cv2.INTER_NEAREST)
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                    
+                    # 큐가 가득 차면 표시가 따라올 때까지 대기
+                    if not put((frame_idx, rgb_buf)):
+                        break
+                    frame_idx += 1
                 
-                # 라벨 업데이트
-                try:
-                    video_label.configure(image=photo)
-                    video_label.image = photo
-                    self._video_window.update()
-                except:
-                    break
-                
-                cv2.waitKey(delay)
+            except cv2.error as e:
+                print(f"Video decoding error: {e}")
+            finally:
+                # 오류가 나도 재생 끝을 알려 표시 루프가 멈추게 함
+                cap.release()
+                put(None)
+        
+        def pump():
+            """메인 스레드: 큐에서 프레임을 꺼내 표시하고 다음 표시 예약"""
+            if stop.is_set():
+                return  # 창 닫힘
+            
+            try:
+                item = frame_q.get_nowait()
+            except queue.Empty:
+                self.root.after(5, pump)
+                return
+            
+            if item is None:
+                return  # 재생 끝
             
-            cap.release()
+            frame_idx, rgb_buf = item
+            height, width = rgb_buf.shape[:2]
+            
+            # 표시용 이미지는 첫 프레임에서 한 번만 생성
+            if self._video_pil is None:
+                self._video_pil = Image.new("RGB", (width, height))
+                self._video_photo = ImageTk.PhotoImage("RGB", (width, height))
+                video_label.configure(image=self._video_photo)
+            
+            # 기존 이미지에 픽셀만 갱신 (ndarray 버퍼를 복사 없이 전달)
+            self._video_pil.frombytes(rgb_buf)
+            self._video_photo.paste(self._video_pil)
+            
+            # 다음 프레임 표시 시각에 맞춰 예약
+            next_deadline = clock["t0"] + (frame_idx + 1) / clock["fps"]
+            delay = max(1, int((next_deadline - time.perf_counter()) * 1000))
+            self.root.after(delay, pump)
         
-        # 별도 스레드에서 재생
-        threading.Thread(target=play_video, daemon=True).start()
+        threading.Thread(target=decode, daemon=True).start()
+        self.root.after_idle(pump)
     
     def _delete_memo(self, memo: dict):
         """메모 삭제"""
-        type_text = "음성 메모" if memo["type"] == "voice" else "영상 메모"
+        type_text = _TYPE_TEXTS[memo["type"]]
         
         if messagebox.askyesno("삭제 확인", f"이 {type_text}를 삭제하시겠습니까?"):
             if self.memo_manager.delete_memo(memo["filepath"]):
+                self._thumbs.pop(memo["filepath"], None)
                 self.refresh_memos()
             else:
                 messagebox.showerror("오류", "메모 삭제에 실패했습니다.")
@@ -377,8 +739,7 @@ class MemoPlayerUI:
     
     def destroy(self):
         """UI 종료"""
-        if self._video_window:
-            self._video_window.destroy()
+        self._close_video()
         self.root.destroy()
 
 